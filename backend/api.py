@@ -10,21 +10,27 @@ Run:
 
 from __future__ import annotations
 
+import codecs
 from pathlib import Path
 from typing import List, Optional
 
+import aiofiles
 from fastapi import FastAPI, File, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
 from backend.job_parser import parse_job_description
 from backend.matcher import matches_to_jsonable, rank_candidates
 from backend.resume_parser import parse_resumes_in_dir, parse_resume
-from backend.utils import ensure_dir, setup_logger, write_text
+from backend.utils import ensure_dir, setup_logger
 
 
 logger = setup_logger()
 
+# Uploads are streamed to disk in chunks of this size, never read whole.
+UPLOAD_CHUNK_SIZE = 1 << 20
+
 app = FastAPI(title="Resume Screening & Skill Matching API", version="1.0.0")
 
 @app.on_event("startup")
@@ -56,6 +62,7 @@ def health() -> dict:
 
 @app.post("/rank")
 def rank(req: RankRequest) -> dict:
+    # Sync route: FastAPI already runs it in the threadpool, off the event loop.
     jd = parse_job_description(req.jd_path)
     resumes = parse_resumes_in_dir(req.resumes_dir)
     matches = rank_candidates(
@@ -81,8 +88,11 @@ async def upload_jd(file: UploadFile = File(...)) -> dict:
     """
     uploads = ensure_dir("outputs/uploads")
     dest = Path(uploads) / file.filename
-    content = (await file.read()).decode("utf-8", errors="ignore")
-    write_text(dest, content)
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    async with aiofiles.open(dest, "w", encoding="utf-8") as f:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            await f.write(decoder.decode(chunk))
+        await f.write(decoder.decode(b"", final=True))
     logger.info(f"Uploaded JD: {dest}")
     return {"saved_to": str(dest)}
 
@@ -94,9 +104,11 @@ async def upload_resume(file: UploadFile = File(...)) -> dict:
     """
     uploads = ensure_dir("outputs/uploads")
     dest = Path(uploads) / file.filename
-    data = await file.read()
-    dest.write_bytes(data)
-    parsed = parse_resume(dest)
+    async with aiofiles.open(dest, "wb") as f:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            await f.write(chunk)
+    # PDF/DOCX parsing is blocking; keep it off the event loop.
+    parsed = await run_in_threadpool(parse_resume, dest)
     return {
         "file_path": parsed.file_path,
         "name": parsed.name,
@@ -14,8 +14,8 @@ from pathlib import Path
 
 from backend.job_parser import parse_job_description
 from backend.matcher import matches_to_jsonable, rank_candidates
-from backend.resume_parser import parse_resumes_in_dir, parsed_resumes_to_rows
-from backend.utils import ensure_dir, setup_logger, write_csv_rows, write_json
+from backend.resume_parser import PARSED_RESUME_CSV_HEADER, parse_resumes_in_dir, parsed_resumes_to_rows
+from backend.utils import ensure_dir, setup_logger, write_csv_columns, write_csv_rows, write_csv_stream, write_json
 
 
 logger = setup_logger()
@@ -60,7 +60,9 @@ def main() -> None:
         write_csv_rows(Path(out_dir) / "parsed_job.csv", [jd.to_dict()])
 
         write_json(Path(out_dir) / "parsed_resumes.json", [r.to_dict() for r in parsed])
-        write_csv_rows(Path(out_dir) / "parsed_resumes.csv", parsed_resumes_to_rows(parsed))
+        write_csv_stream(
+            Path(out_dir) / "parsed_resumes.csv", PARSED_RESUME_CSV_HEADER, parsed_resumes_to_rows(parsed)
+        )
 
     matches = rank_candidates(
         parsed_resumes=parsed,
@@ -85,35 +87,31 @@ def main() -> None:
     out_json = Path(out_dir) / "ranking_and_skill_gap.json"
     write_json(out_json, payload)
 
-    # CSV exports (nice for evaluation / Excel)
-    ranking_rows = []
-    gap_rows = []
-    for m in matches:
-        ranking_rows.append(
-            {
-                "name": m.name,
-                "resume_path": m.resume_path,
-                "match_score": m.match_score,
-                "semantic_similarity": m.semantic_similarity,
-                "resume_quality_score": m.resume_quality_score,
-                "education_boost": m.education_boost,
-                "experience_boost": m.experience_boost,
-                "skill_match_percentage": m.skill_gap.match_percentage,
-            }
-        )
-        gap_rows.append(
-            {
-                "name": m.name,
-                "matched_skills": ", ".join(m.skill_gap.matched_skills),
-                "missing_skills": ", ".join(m.skill_gap.missing_skills),
-                "skill_match_percentage": m.skill_gap.match_percentage,
-            }
-        )
+    # CSV exports (nice for evaluation / Excel), written column-wise from the
+    # ranked arrays without building per-row dicts
+    gaps = matches.skill_gaps
+    skill_pct = [g.match_percentage for g in gaps]
+    ranking_cols = {
+        "name": matches.names,
+        "resume_path": matches.paths,
+        "match_score": matches.match_score.tolist(),
+        "semantic_similarity": matches.sim.tolist(),
+        "resume_quality_score": matches.quality.tolist(),
+        "education_boost": matches.edu.tolist(),
+        "experience_boost": matches.exp.tolist(),
+        "skill_match_percentage": skill_pct,
+    }
+    gap_cols = {
+        "name": matches.names,
+        "matched_skills": [", ".join(g.matched_skills) for g in gaps],
+        "missing_skills": [", ".join(g.missing_skills) for g in gaps],
+        "skill_match_percentage": skill_pct,
+    }
 
     out_rank_csv = Path(out_dir) / "candidate_ranking.csv"
     out_gap_csv = Path(out_dir) / "skill_gap_report.csv"
-    write_csv_rows(out_rank_csv, ranking_rows)
-    write_csv_rows(out_gap_csv, gap_rows)
+    write_csv_columns(out_rank_csv, ranking_cols)
+    write_csv_columns(out_gap_csv, gap_cols)
 
     logger.info(f"Wrote results: {out_json}")
     logger.info(f"Wrote CSV: {out_rank_csv}")
@@ -0,0 +1,99 @@
+"""
+emb_cache.py
+------------
+Small on-disk cache of text embeddings backed by SQLite.
+
+Entries are keyed by sha1(version || model_name || variant || text), where
+variant names the inference backend and quantization that produced the
+vector, so vectors from different settings never mix. Unchanged
+resumes/JDs are never re-encoded across runs and partially changed batches
+only encode the new texts.
+
+Set RSS_EMB_CACHE to a file path to relocate the cache, or to "off" to disable it.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
+from backend.utils import ensure_dir, setup_logger
+
+
+logger = setup_logger()
+
+# Bump when skill normalization or the embedded text format changes.
+CACHE_VERSION = "v1"
+DEFAULT_CACHE_PATH = "outputs/cache/embeddings.sqlite3"
+
+# Stay below SQLite's default limit on bound parameters per statement.
+_MAX_PARAMS = 500
+
+
+class EmbeddingCache:
+    def __init__(self, path: Union[str, Path] = DEFAULT_CACHE_PATH) -> None:
+        self.path = Path(path)
+        ensure_dir(self.path.parent)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                " key TEXT PRIMARY KEY, dim INTEGER NOT NULL, vec BLOB NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.path), timeout=30)
+
+    @staticmethod
+    def _key(model_name: str, variant: str, text: str) -> str:
+        return hashlib.sha1(f"{CACHE_VERSION}\0{model_name}\0{variant}\0{text}".encode("utf-8")).hexdigest()
+
+    def get_many(self, model_name: str, texts: Sequence[str], variant: str = "") -> List[Optional[np.ndarray]]:
+        """
+        Return one float32 vector per text, or None where the text is not cached.
+        """
+        keys = [self._key(model_name, variant, t) for t in texts]
+        found = {}
+        try:
+            with closing(self._connect()) as conn:
+                for i in range(0, len(keys), _MAX_PARAMS):
+                    chunk = keys[i : i + _MAX_PARAMS]
+                    marks = ",".join("?" * len(chunk))
+                    rows = conn.execute(f"SELECT key, dim, vec FROM embeddings WHERE key IN ({marks})", chunk)
+                    for key, dim, vec in rows:
+                        arr = np.frombuffer(vec, dtype=np.float32)
+                        if arr.shape[0] == dim:
+                            found[key] = arr
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache read failed ({self.path}): {e}")
+        return [found.get(k) for k in keys]
+
+    def put_many(self, model_name: str, texts: Sequence[str], embeddings: np.ndarray, variant: str = "") -> None:
+        emb = np.asarray(embeddings, dtype=np.float32)
+        rows = [(self._key(model_name, variant, t), int(e.shape[0]), e.tobytes()) for t, e in zip(texts, emb)]
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.executemany("INSERT OR REPLACE INTO embeddings (key, dim, vec) VALUES (?, ?, ?)", rows)
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache write failed ({self.path}): {e}")
+
+
+@functools.lru_cache(maxsize=1)
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """
+    Process-wide cache instance, or None when disabled or unusable.
+    """
+    path = os.environ.get("RSS_EMB_CACHE", DEFAULT_CACHE_PATH).strip()
+    if not path or path.lower() == "off":
+        return None
+    try:
+        return EmbeddingCache(path)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"Embedding cache disabled ({path}): {e}")
+        return None
@@ -11,12 +11,21 @@ Output is a structured model that downstream modules can use consistently.
 
 from __future__ import annotations
 
+import mmap
 import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Union
 
-from backend.utils import DEFAULT_SKILL_VOCAB, normalize_skill, normalize_text, setup_logger, unique_preserve_order
+from backend.utils import (
+    DEFAULT_SKILL_VOCAB,
+    find_phrases,
+    normalize_skill,
+    normalize_text,
+    phrase_index,
+    setup_logger,
+    unique_preserve_order,
+)
 
 
 logger = setup_logger()
@@ -44,9 +53,30 @@ class ParsedJobDescription:
 
 DEFAULT_JD_SKILL_HINTS = DEFAULT_SKILL_VOCAB
 
+# Files above this size are read through mmap.
+_MMAP_MIN_BYTES = 64 * 1024
+
+_RE_TITLE = re.compile(r"^(job\s*title\s*:\s*)(.+)$", re.I)
+_RE_BULLET_SPLIT = re.compile(r"[,/|\n•\-\u2022]+")
+_RE_EDU_BS = re.compile(r"\b(b\.?tech|btech|be|b\.?e|bsc)\b", re.I)
+_RE_EDU_MS = re.compile(r"\b(m\.?tech|mtech|me|msc|mba)\b", re.I)
+_RE_EDU_PHD = re.compile(r"\b(phd|doctorate)\b", re.I)
+_RE_EXP_PLUS = re.compile(r"\b\d+\s*\+\s*years?\b", re.I)
+_RE_EXP_RANGE = re.compile(r"\b\d+\s*-\s*\d+\s*years?\b", re.I)
+_RE_EXP_TO = re.compile(r"\b\d+\s*to\s*\d+\s*years?\b", re.I)
+
 
 def _read_txt(path: Union[str, Path]) -> str:
-    return Path(path).read_text(encoding="utf-8", errors="ignore").strip()
+    p = Path(path)
+    if p.stat().st_size <= _MMAP_MIN_BYTES:
+        return p.read_text(encoding="utf-8", errors="ignore").strip()
+    # Large JDs: decode straight from the page-cache mapping, no bytes copy first.
+    with p.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        text = str(mm, "utf-8", "ignore")
+    if "\r" in text:
+        # match read_text()'s universal newline handling
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text.strip()
 
 
 def _extract_title(text: str) -> Optional[str]:
@@ -54,7 +84,7 @@ def _extract_title(text: str) -> Optional[str]:
     if not lines:
         return None
     # First line like "Job Title: X" or just "Data Scientist"
-    m = re.match(r"^(job\s*title\s*:\s*)(.+)$", lines[0], re.I)
+    m = _RE_TITLE.match(lines[0])
     if m:
         return m.group(2).strip()
     if len(lines[0]) <= 60:
@@ -68,8 +98,8 @@ def extract_required_skills(text: str, skill_hints: Optional[Sequence[str]] = No
     - explicit "Requirements" / "Skills" section if present
     - otherwise scan whole JD for known skill hints
     """
-    hints = [normalize_skill(s) for s in (skill_hints or DEFAULT_JD_SKILL_HINTS)]
-    t_norm = normalize_text(text)
+    hints = tuple(normalize_skill(s) for s in (skill_hints or DEFAULT_JD_SKILL_HINTS))
+    hint_set, _ = phrase_index(hints)
 
     # section-based parsing
     lines = [ln.strip() for ln in (text or "").splitlines()]
@@ -88,22 +118,22 @@ def extract_required_skills(text: str, skill_hints: Optional[Sequence[str]] = No
     found: List[str] = []
 
     def scan(hay: str) -> None:
-        for h in hints:
-            if h and re.search(rf"(^| )({re.escape(h)})( |$)", hay):
-                found.append(h)
+        matched = find_phrases(hay, hints)
+        # report in hint order, not text order
+        found.extend(h for h in hints if h in matched)
 
     if section_norm:
         scan(section_norm)
     else:
-        scan(t_norm)
+        scan(normalize_text(text))
 
     # token extraction from bullet lists
     if req_idx is not None:
         blob = "\n".join(lines[req_idx : req_idx + 60])
-        tokens = re.split(r"[,/|\n•\-\u2022]+", blob)
+        tokens = _RE_BULLET_SPLIT.split(blob)
         for tok in tokens:
             s = normalize_skill(tok)
-            if s in hints:
+            if s in hint_set:
                 found.append(s)
 
     return unique_preserve_order([f for f in found if f])
@@ -112,12 +142,8 @@ def extract_required_skills(text: str, skill_hints: Optional[Sequence[str]] = No
 def extract_required_education(text: str) -> List[str]:
     t = text or ""
     out: List[str] = []
-    for pat in [
-        r"\b(b\.?tech|btech|be|b\.?e|bsc)\b",
-        r"\b(m\.?tech|mtech|me|msc|mba)\b",
-        r"\b(phd|doctorate)\b",
-    ]:
-        m = re.findall(pat, t, flags=re.I)
+    for pat in (_RE_EDU_BS, _RE_EDU_MS, _RE_EDU_PHD):
+        m = pat.findall(t)
         out.extend([normalize_text(x) for x in m])
     return unique_preserve_order([o for o in out if o])
 
@@ -129,14 +155,9 @@ def extract_required_experience(text: str) -> List[str]:
     - "3-5 years"
     """
     t = text or ""
-    patterns = [
-        r"\b\d+\s*\+\s*years?\b",
-        r"\b\d+\s*-\s*\d+\s*years?\b",
-        r"\b\d+\s*to\s*\d+\s*years?\b",
-    ]
     out: List[str] = []
-    for pat in patterns:
-        out.extend([normalize_text(m) for m in re.findall(pat, t, flags=re.I)])
+    for pat in (_RE_EXP_PLUS, _RE_EXP_RANGE, _RE_EXP_TO):
+        out.extend([normalize_text(m) for m in pat.findall(t)])
     return unique_preserve_order([o for o in out if o])
 
 
@@ -10,17 +10,39 @@ string (e.g. "python sql fastapi") works well in practice and is fast.
 
 from __future__ import annotations
 
+import datetime
+import os
+import re
 from dataclasses import dataclass
-from typing import Any, Dict, List, Sequence, Tuple
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
-from backend.skill_gap import SkillGapReport, generate_skill_gap
-from backend.utils import normalize_text, setup_logger
+from backend.emb_cache import get_embedding_cache
+from backend.skill_gap import SkillGapReport, generate_skill_gap, skill_set
+from backend.utils import DEFAULT_SKILL_VOCAB, normalize_text, setup_logger
+
+try:
+    from sentence_transformers import SentenceTransformer  # type: ignore
+except ImportError:
+    # Optional at runtime: matching falls back to Jaccard similarity.
+    SentenceTransformer = None
 
 
 logger = setup_logger()
 
+# Large enough that a whole ranking run is one batch: encode() length-sorts its
+# input before batching, so a single big batch keeps padding to a minimum.
+ENCODE_BATCH_SIZE = 1024
+
+# JDs with at most this many required skills are scored by exact skill coverage;
+# embeddings add nothing there, so the model is never loaded for them.
+SMALL_REQUIREMENT_MAX = 2
+
+# Optimized ONNX graph produced by scripts/export_onnx.py (or shipped by the hub repo).
+# Override with RSS_ONNX_FILE, e.g. "model_O4.onnx" after exporting with --level O4.
+ONNX_FILE_NAME = "model_O3.onnx"
+
 
 @dataclass
 class CandidateMatch:
@@ -34,25 +56,137 @@ class CandidateMatch:
     skill_gap: SkillGapReport
 
 
-def _cosine_sim(a: np.ndarray, b: np.ndarray) -> float:
-    denom = (np.linalg.norm(a) * np.linalg.norm(b)) + 1e-12
-    return float(np.dot(a, b) / denom)
+@dataclass
+class CandidateMatches:
+    """
+    Ranked candidates stored column-wise (struct of arrays).
+    Iterating yields CandidateMatch rows, so callers can treat it like a list.
+    """
+    names: List[str]
+    paths: List[str]
+    match_score: np.ndarray  # 0..100
+    sim: np.ndarray  # 0..1
+    quality: np.ndarray  # 0..1
+    edu: np.ndarray  # 0..1
+    exp: np.ndarray  # 0..1
+    skill_gaps: List[SkillGapReport]
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[CandidateMatch]) -> "CandidateMatches":
+        return cls(
+            names=[m.name for m in rows],
+            paths=[m.resume_path for m in rows],
+            match_score=np.array([m.match_score for m in rows], dtype=np.float64),
+            sim=np.array([m.semantic_similarity for m in rows], dtype=np.float64),
+            quality=np.array([m.resume_quality_score for m in rows], dtype=np.float64),
+            edu=np.array([m.education_boost for m in rows], dtype=np.float64),
+            exp=np.array([m.experience_boost for m in rows], dtype=np.float64),
+            skill_gaps=[m.skill_gap for m in rows],
+        )
+
+    def take(self, idx: np.ndarray) -> "CandidateMatches":
+        """
+        Reorder / subset every column by the given index array.
+        """
+        return CandidateMatches(
+            names=[self.names[i] for i in idx],
+            paths=[self.paths[i] for i in idx],
+            match_score=self.match_score[idx],
+            sim=self.sim[idx],
+            quality=self.quality[idx],
+            edu=self.edu[idx],
+            exp=self.exp[idx],
+            skill_gaps=[self.skill_gaps[i] for i in idx],
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[CandidateMatch, "CandidateMatches"]:
+        if isinstance(i, slice):
+            # like list slicing: matches[:k] is again a CandidateMatches
+            return self.take(np.arange(len(self))[i])
+        return CandidateMatch(
+            name=self.names[i],
+            resume_path=self.paths[i],
+            match_score=float(self.match_score[i]),
+            semantic_similarity=float(self.sim[i]),
+            resume_quality_score=float(self.quality[i]),
+            education_boost=float(self.edu[i]),
+            experience_boost=float(self.exp[i]),
+            skill_gap=self.skill_gaps[i],
+        )
+
+    def __iter__(self) -> Iterator[CandidateMatch]:
+        for i in range(len(self)):
+            yield self[i]
 
 
 def _join_skills(skills: Sequence[str]) -> str:
     return " ".join([s for s in skills if s])
 
 
+# One bit per skill. Vocab skills get fixed bits 0..V-1 up front (read-only).
+_VOCAB_SKILL_BITS: Dict[str, int] = {
+    s: i for i, s in enumerate(dict.fromkeys(s.strip().lower() for s in DEFAULT_SKILL_VOCAB))
+}
+
+
+def _skill_bits() -> Dict[str, int]:
+    """
+    Fresh bit table for one scoring call. Skills outside the vocab get the next
+    free bit in this table only, so module state never grows with the input.
+    """
+    return dict(_VOCAB_SKILL_BITS)
+
+
+def _skill_mask(skills: Sequence[str], bits: Dict[str, int]) -> int:
+    """
+    Encode a skill list as an int bitmask so set algebra becomes & / | / popcount.
+    Masks are only comparable when built from the same `bits` table.
+    """
+    mask = 0
+    for s in skills:
+        key = s.strip().lower() if s else ""
+        if not key:
+            continue
+        bit = bits.get(key)
+        if bit is None:
+            bit = bits[key] = len(bits)
+        mask |= 1 << bit
+    return mask
+
+
+def _jaccard_from_masks(ma: int, mb: int) -> float:
+    if not ma or not mb:
+        return 0.0
+    return (ma & mb).bit_count() / max((ma | mb).bit_count(), 1)
+
+
+def _coverage_from_masks(cand_mask: int, req_mask: int) -> float:
+    """
+    Fraction of required skills the candidate has, in [0, 1].
+    """
+    if not req_mask:
+        return 0.0
+    return (cand_mask & req_mask).bit_count() / req_mask.bit_count()
+
+
 def _jaccard_similarity(a: Sequence[str], b: Sequence[str]) -> float:
     """
     Lightweight fallback similarity when embeddings aren't available.
     Returns a score in [0, 1].
     """
-    sa = {x.strip().lower() for x in a if x and x.strip()}
-    sb = {x.strip().lower() for x in b if x and x.strip()}
-    if not sa or not sb:
-        return 0.0
-    return len(sa.intersection(sb)) / max(len(sa.union(sb)), 1)
+    bits = _skill_bits()
+    return _jaccard_from_masks(_skill_mask(a, bits), _skill_mask(b, bits))
+
+
+_RE_RANGE = re.compile(r"\b(\d+)\s*-\s*(\d+)\s*years?\b")
+_RE_PLUS = re.compile(r"\b(\d+)\s*\+\s*years?\b")
+_RE_YEARS = re.compile(r"\b(\d+)\s*years?\b")
+_RE_YEARSPAN = re.compile(r"\b(19\d{2}|20\d{2})\s*[-–]\s*(19\d{2}|20\d{2}|present|current)\b")
+_RE_YEAR = re.compile(r"\b(19\d{2}|20\d{2})\b")
+
 
 def _parse_required_years(required_experience: Sequence[str]) -> int:
     """
@@ -62,23 +196,22 @@ def _parse_required_years(required_experience: Sequence[str]) -> int:
     into a conservative minimum years integer.
     """
     mins: List[int] = []
-    import re
 
     for s in required_experience or []:
         t = normalize_text(s)
         m = None
         # 3-5 years
-        m = re.search(r"\b(\d+)\s*-\s*(\d+)\s*years?\b", t)
+        m = _RE_RANGE.search(t)
         if m:
             mins.append(int(m.group(1)))
             continue
         # 2+ years
-        m = re.search(r"\b(\d+)\s*\+\s*years?\b", t)
+        m = _RE_PLUS.search(t)
         if m:
             mins.append(int(m.group(1)))
             continue
         # 2 years
-        m = re.search(r"\b(\d+)\s*years?\b", t)
+        m = _RE_YEARS.search(t)
         if m:
             mins.append(int(m.group(1)))
             continue
@@ -93,13 +226,10 @@ def _estimate_candidate_years(experience_items: Sequence[Any]) -> float:
     - "2021 - 2023"
     Falls back to 0.0 if not available.
     """
-    import datetime as _dt
-    import re as _re
-
     if not experience_items:
         return 0.0
 
-    now_year = _dt.datetime.now().year
+    now_year = datetime.datetime.now().year
     total_years = 0.0
 
     for ex in experience_items:
@@ -109,7 +239,7 @@ def _estimate_candidate_years(experience_items: Sequence[Any]) -> float:
             continue
 
         # year span: 2021 - 2023 / 2021 - present
-        m = _re.search(r"\b(19\d{2}|20\d{2})\s*[-–]\s*(19\d{2}|20\d{2}|present|current)\b", t)
+        m = _RE_YEARSPAN.search(t)
         if m:
             start = int(m.group(1))
             end_raw = m.group(2)
@@ -120,7 +250,7 @@ def _estimate_candidate_years(experience_items: Sequence[Any]) -> float:
 
         # month year - month year (approx): "jun 2022 - aug 2023"
         # We'll approximate by using the year difference when present.
-        years = [int(y) for y in _re.findall(r"\b(19\d{2}|20\d{2})\b", t)]
+        years = [int(y) for y in _RE_YEAR.findall(t)]
         if len(years) >= 2 and years[-1] >= years[0]:
             total_years += float(years[-1] - years[0])
             continue
@@ -145,20 +275,210 @@ def _education_match_boost(candidate_education: Sequence[Any], required_educatio
     return 1.0 if (has_req and has_cand) else 0.0
 
 
-# Global model cache
-_MODEL_CACHE = {}
+def _onnx_file_name() -> str:
+    return os.environ.get("RSS_ONNX_FILE", "").strip() or ONNX_FILE_NAME
 
-def get_model(model_name: str = "sentence-transformers/all-MiniLM-L6-v2"):
-    if model_name not in _MODEL_CACHE:
-        logger.info(f"Loading model: {model_name}...")
+
+def _configured_backend() -> str:
+    return os.environ.get("RSS_BACKEND", "onnx").strip().lower()
+
+
+def _build_model(model_name: str) -> Tuple[Any, str]:
+    """
+    Build the model on the backend selected by the RSS_BACKEND env var
+    ("onnx" by default, "openvino", or "torch"). The ONNX graph file is
+    RSS_ONNX_FILE (default ONNX_FILE_NAME). Falls back to the default
+    PyTorch backend when the runtime or the exported graph is unavailable.
+    Returns (model, backend actually used).
+    """
+    backend = _configured_backend()
+    if backend in {"onnx", "openvino"}:
+        model_kwargs = {}
+        if backend == "onnx":
+            model_kwargs = {"file_name": _onnx_file_name(), "provider": "CPUExecutionProvider"}
         try:
-            from sentence_transformers import SentenceTransformer
-            _MODEL_CACHE[model_name] = SentenceTransformer(model_name)
-            logger.info("Model loaded successfully.")
+            return SentenceTransformer(model_name, backend=backend, model_kwargs=model_kwargs), backend
         except Exception as e:
-            logger.error(f"Failed to load model {model_name}: {e}")
-            return None
-    return _MODEL_CACHE.get(model_name)
+            logger.info(f"{backend} backend unavailable for {model_name} ({e}); using torch.")
+    return SentenceTransformer(model_name), "torch"
+
+
+def _quantize_model(model) -> Tuple[Any, str]:
+    """
+    Optionally shrink the transformer weights for CPU inference, controlled by
+    the RSS_QUANTIZE env var:
+    - "int8": dynamic int8 quantization of all Linear layers
+    - "fp16": cast weights to half precision
+    - "off" (default): leave the model untouched
+    Expect small cosine drift (around 1e-3) on the quantized paths.
+    Only applies to the PyTorch backend.
+    Returns (model, mode actually applied), the mode being "off" when skipped.
+    """
+    mode = os.environ.get("RSS_QUANTIZE", "off").strip().lower()
+    if mode in {"", "off"}:
+        return model, "off"
+    if getattr(model, "backend", "torch") != "torch":
+        # ONNX / OpenVINO graphs are optimized at export time.
+        return model, "off"
+    if mode not in {"int8", "fp16"}:
+        logger.warning(f"Unknown RSS_QUANTIZE={mode!r}; expected int8, fp16 or off.")
+        return model, "off"
+
+    try:
+        import torch  # type: ignore
+    except ImportError:
+        logger.warning("torch is not available; skipping quantization.")
+        return model, "off"
+
+    device = getattr(model, "device", None)
+    if device is not None and device.type != "cpu":
+        return model, "off"
+
+    try:
+        if mode == "int8":
+            first = model._first_module()
+            first.auto_model = torch.quantization.quantize_dynamic(
+                first.auto_model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+        else:
+            model.half()
+        logger.info(f"Applied {mode} quantization.")
+    except Exception as e:
+        logger.error(f"Quantization ({mode}) failed, using full precision: {e}")
+        return model, "off"
+    return model, mode
+
+
+# Successfully loaded models only, so a failed load is retried on the next call.
+_MODEL_CACHE: Dict[str, Any] = {}
+# Embedding-cache variant of each loaded model, from the backend and quantization
+# that actually took effect (see _embedding_variant).
+_MODEL_VARIANTS: Dict[str, str] = {}
+
+
+def _get_model(model_name: str):
+    """
+    Build a SentenceTransformer once per process and model name.
+    Returns None (and caches nothing) when the model cannot be loaded.
+    """
+    model = _MODEL_CACHE.get(model_name)
+    if model is not None:
+        return model
+    if SentenceTransformer is None:
+        logger.warning("sentence-transformers is not installed; using Jaccard similarity.")
+        return None
+    logger.info(f"Loading model: {model_name}...")
+    try:
+        model, backend = _build_model(model_name)
+    except Exception as e:
+        logger.error(f"Failed to load model {model_name}: {e}")
+        return None
+    logger.info("Model loaded successfully.")
+    model, quantize = _quantize_model(model)
+    _MODEL_VARIANTS[model_name] = _variant_tag(backend, quantize)
+    _MODEL_CACHE[model_name] = model
+    return model
+
+
+def get_model(model_name: str = "sentence-transformers/all-MiniLM-L6-v2"):
+    return _get_model(model_name)
+
+
+def _encode_texts(texts: Sequence[str], model_name: str) -> Optional[np.ndarray]:
+    """
+    Encode all texts in a single batched call.
+    Identical texts (e.g. resumes listing the same skills) are encoded once and
+    fanned back out. Texts already in the on-disk embedding cache are not
+    re-encoded; the model is only loaded when at least one text misses.
+    Texts must be raw strings (no manual padding); encode() sorts them by length
+    internally so each batch is padded only to its own longest item.
+    Rows are unit-normalized, so a dot product between rows is the cosine similarity.
+    Returns None when no model is available.
+    """
+    slots: Dict[str, int] = {}
+    inverse = [slots.setdefault(t, len(slots)) for t in texts]
+    embeddings = _encode_unique(list(slots), model_name)
+    if embeddings is None or len(slots) == len(inverse):
+        return embeddings
+    return embeddings[inverse]
+
+
+def _variant_tag(backend: str, quantize: str) -> str:
+    if backend == "onnx":
+        # graphs exported at different optimization levels (e.g. O4 is fp16) differ
+        backend = f"onnx:{_onnx_file_name()}"
+    if backend != "torch":
+        # quantization only applies to torch; see _quantize_model
+        return f"backend={backend}"
+    return f"backend=torch;quantize={quantize}"
+
+
+def _embedding_variant(model_name: str) -> str:
+    """
+    Embedding-cache tag for the backend and quantization producing the vectors.
+    Once the model is loaded this is what actually took effect (e.g. torch after
+    an ONNX fallback); before that it is read from the environment, so warm runs
+    never load the model.
+    """
+    loaded = _MODEL_VARIANTS.get(model_name)
+    if loaded is not None:
+        return loaded
+    quantize = os.environ.get("RSS_QUANTIZE", "off").strip().lower() or "off"
+    return _variant_tag(_configured_backend(), quantize)
+
+
+def _encode_unique(texts: List[str], model_name: str) -> Optional[np.ndarray]:
+    cache = get_embedding_cache()
+
+    def lookup(variant: str) -> List[Optional[np.ndarray]]:
+        return cache.get_many(model_name, texts, variant) if cache else [None] * len(texts)
+
+    variant = _embedding_variant(model_name)
+    rows = lookup(variant)
+    misses = [i for i, row in enumerate(rows) if row is None]
+
+    if not misses:
+        return np.vstack(rows)
+
+    model = _get_model(model_name)
+    if model is None:
+        return None
+    if _embedding_variant(model_name) != variant:
+        # The loaded model differs from the configuration (e.g. ONNX fell back
+        # to torch): never mix its vectors with hits from the configured variant.
+        variant = _embedding_variant(model_name)
+        rows = lookup(variant)
+        misses = [i for i, row in enumerate(rows) if row is None]
+
+    if misses:
+        miss_texts = [texts[i] for i in misses]
+        fresh = model.encode(
+            miss_texts,
+            batch_size=min(ENCODE_BATCH_SIZE, len(miss_texts)),
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        fresh = np.asarray(fresh, dtype=np.float32)
+        if cache:
+            cache.put_many(model_name, miss_texts, fresh, variant)
+        if len(misses) == len(texts):
+            # cold run: hand back encode()'s own contiguous block, no restacking
+            return fresh
+        for i, row in zip(misses, fresh):
+            rows[i] = row
+
+    return np.vstack(rows)
+
+
+def _similarities(embeddings: np.ndarray) -> np.ndarray:
+    """
+    Cosine similarity of rows 1..N (candidates) against row 0 (requirements),
+    clipped to [0, 1]. Rows from _encode_texts are already unit-norm, so this
+    is a plain mat-vec product on the encoded block with no copies.
+    """
+    return np.clip(embeddings[1:] @ embeddings[0], 0.0, 1.0)
+
 
 def compute_match_score(
     candidate_skills: Sequence[str],
@@ -176,20 +496,69 @@ def compute_match_score(
     if not cand_text or not req_text:
         return 0.0, 0.0
 
-    model = get_model(model_name)
-    
-    if not model:
+    bits = _skill_bits()
+    req_mask = _skill_mask(required_skills, bits)
+    if req_mask.bit_count() <= SMALL_REQUIREMENT_MAX:
+        # One or two required skills: an exact coverage check beats a forward pass.
+        sim = _coverage_from_masks(_skill_mask(candidate_skills, bits), req_mask)
+        return round(sim, 4), round(sim * 100.0, 2)
+
+    embeddings = _encode_texts([req_text, cand_text], model_name)
+    if embeddings is None:
         # Fallback to Jaccard if model fails to load
         sim = _jaccard_similarity(candidate_skills, required_skills)
         return round(sim, 4), round(sim * 100.0, 2)
 
-    emb = model.encode([cand_text, req_text], normalize_embeddings=False)
-    sim = _cosine_sim(np.array(emb[0]), np.array(emb[1]))
-    sim = max(0.0, min(1.0, sim))
+    sim = float(_similarities(embeddings)[0])
     score = round(sim * 100.0, 2)
     return sim, score
 
 
+def _score_one(
+    name: str,
+    skills: Sequence[str],
+    q: float,
+    cand_edu: Sequence[Any],
+    cand_exp: Sequence[Any],
+    match_score: float,
+    required_skills: FrozenSet[str],
+    required_education: Sequence[str],
+    req_years: int,
+) -> Tuple[float, float, float, SkillGapReport]:
+    """
+    Score one candidate once its semantic similarity is known.
+    Returns (final_score, education_boost, experience_boost, skill_gap).
+    """
+    # Experience boost: if candidate meets/exceeds required min years.
+    cand_years = _estimate_candidate_years(cand_exp)
+    exp_boost = 0.0
+    if req_years > 0:
+        exp_boost = 1.0 if cand_years >= req_years else (cand_years / max(req_years, 1))
+
+    # Education boost: coarse check.
+    edu_boost = _education_match_boost(cand_edu, required_education)
+
+    # Final score combines:
+    # - semantic match (dominant)
+    # - resume quality (completeness)
+    # - edu/exp boosts (small nudges)
+    final = (
+        0.80 * match_score
+        + 0.12 * (q * 100.0)
+        + 0.05 * (edu_boost * 100.0)
+        + 0.03 * (exp_boost * 100.0)
+    )
+    final = round(max(0.0, min(100.0, final)), 2)
+
+    gap = generate_skill_gap(
+        candidate_name=name,
+        candidate_skills=skills,
+        required_skills=required_skills,
+    )
+
+    return final, round(float(edu_boost), 4), round(float(exp_boost), 4), gap
+
+
 def rank_candidates(
     parsed_resumes: Sequence[Any],
     required_skills: Sequence[str],
@@ -197,135 +566,125 @@ def rank_candidates(
     required_experience: Sequence[str] = (),
     top_n: int = 5,
     model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
-) -> List[CandidateMatch]:
+) -> CandidateMatches:
     """
     parsed_resumes: expects objects with fields:
       - name, file_path, skills, resume_quality_score
+    Returns the top_n candidates, best first.
     """
-    results: List[CandidateMatch] = []
     req_years = _parse_required_years(required_experience)
 
     # 1. Prepare data for batch processing
     req_text = _join_skills(required_skills)
     cand_texts = [_join_skills(getattr(r, "skills", []) or []) for r in parsed_resumes]
-    
-    # 2. Batch encode (vectorize) ONLY if we have text to match
+
+    # 2. Batch encode the JD plus every candidate in ONE call, then score with
+    #    a single matrix-vector product: (N, D) @ (D,) -> (N,)
+    #    The JD shares the list with candidates so it is length-bucketed too.
     match_sims = [0.0] * len(parsed_resumes)
     match_scores = [0.0] * len(parsed_resumes)
+    bits = _skill_bits()
+    req_mask = _skill_mask(required_skills, bits)
 
-    model = get_model(model_name)
-    if model and req_text and any(cand_texts):
+    embeddings = None
+    small_req = req_mask.bit_count() <= SMALL_REQUIREMENT_MAX
+    if not small_req and req_text and any(cand_texts):
         try:
-            # Optimize: Batch encode all candidates + requirement in one go (or 1 + N)
-            # encoding [req_text] + cand_texts
-            all_texts = [req_text] + cand_texts
-            embeddings = model.encode(all_texts, normalize_embeddings=True)
-            
-            # embeddings[0] is req, embeddings[1:] are candidates
-            req_emb = embeddings[0]
-            cand_embs = embeddings[1:]
-            
-            # vectorized cosine similarity
-            # (N, D) dot (D,) -> (N,)
-            cosine_scores = np.dot(cand_embs, req_emb)
-            
-            # Clip and scale
-            for i, score in enumerate(cosine_scores):
-                sim = max(0.0, min(1.0, float(score)))
-                match_sims[i] = sim
-                match_scores[i] = round(sim * 100.0, 2)
-
+            embeddings = _encode_texts([req_text] + cand_texts, model_name)
         except Exception as e:
             logger.exception(f"Batch embedding failed: {e}")
-            # Fallback to manual/individual score if batch fails (unlikely)
-    else:
-        # Fallback for Jaccard or no model
-        for i, ct in enumerate(cand_texts):
-             cand_skills = getattr(parsed_resumes[i], "skills", []) or []
-             sim = _jaccard_similarity(cand_skills, required_skills)
-             match_sims[i] = round(sim, 4)
-             match_scores[i] = round(sim * 100.0, 2)
 
-
-    # 3. Assemble results with other factors
+    if embeddings is not None:
+        for i, sim in enumerate(_similarities(embeddings).tolist()):
+            match_sims[i] = sim
+            match_scores[i] = round(sim * 100.0, 2)
+    else:
+        # Tiny JDs: required-skill coverage. Otherwise Jaccard fallback (no model).
+        similarity = _coverage_from_masks if small_req else _jaccard_from_masks
+        for i, r in enumerate(parsed_resumes):
+            cand_skills = getattr(r, "skills", []) or []
+            sim = similarity(_skill_mask(cand_skills, bits), req_mask)
+            match_sims[i] = round(sim, 4)
+            match_scores[i] = round(sim * 100.0, 2)
+
+
+    # 3. Assemble results with other factors, column by column
+    required_set = skill_set(required_skills)
+    names: List[str] = []
+    paths: List[str] = []
+    finals: List[float] = []
+    quals: List[float] = []
+    edus: List[float] = []
+    exps: List[float] = []
+    gaps: List[SkillGapReport] = []
     for i, r in enumerate(parsed_resumes):
         name = (getattr(r, "name", None) or "Unknown").strip()
-        resume_path = getattr(r, "file_path", "")
-        skills = getattr(r, "skills", []) or []
         q = float(getattr(r, "resume_quality_score", 0.0) or 0.0)
-        cand_edu = getattr(r, "education", []) or []
-        cand_exp = getattr(r, "experience", []) or []
-
-        # Retrieve pre-calculated scores
-        sim = match_sims[i]
-        match_score = match_scores[i]
-
-        # Experience boost: if candidate meets/exceeds required min years.
-        cand_years = _estimate_candidate_years(cand_exp)
-        exp_boost = 0.0
-        if req_years > 0:
-            exp_boost = 1.0 if cand_years >= req_years else (cand_years / max(req_years, 1))
-
-        # Education boost: coarse check.
-        edu_boost = _education_match_boost(cand_edu, required_education)
-
-        # Final score combines:
-        # - semantic match (dominant)
-        # - resume quality (completeness)
-        # - edu/exp boosts (small nudges)
-        final = (
-            0.80 * match_score
-            + 0.12 * (q * 100.0)
-            + 0.05 * (edu_boost * 100.0)
-            + 0.03 * (exp_boost * 100.0)
-        )
-        final = round(max(0.0, min(100.0, final)), 2)
-
-        gap = generate_skill_gap(
-            candidate_name=name,
-            candidate_skills=skills,
-            required_skills=required_skills,
+        final, edu_boost, exp_boost, gap = _score_one(
+            name=name,
+            skills=getattr(r, "skills", []) or [],
+            q=q,
+            cand_edu=getattr(r, "education", []) or [],
+            cand_exp=getattr(r, "experience", []) or [],
+            match_score=match_scores[i],
+            required_skills=required_set,
+            required_education=required_education,
+            req_years=req_years,
         )
-
-        results.append(
-            CandidateMatch(
-                name=name,
-                resume_path=resume_path,
-                match_score=final,
-                semantic_similarity=round(sim, 4),
-                resume_quality_score=round(q, 4),
-                education_boost=round(float(edu_boost), 4),
-                experience_boost=round(float(exp_boost), 4),
-                skill_gap=gap,
-            )
-        )
-
-    results.sort(key=lambda x: x.match_score, reverse=True)
-    return results[: max(1, top_n)]
-
-
-def matches_to_jsonable(matches: Sequence[CandidateMatch]) -> List[Dict[str, Any]]:
+        names.append(name)
+        paths.append(getattr(r, "file_path", ""))
+        finals.append(final)
+        quals.append(round(q, 4))
+        edus.append(edu_boost)
+        exps.append(exp_boost)
+        gaps.append(gap)
+
+    ranked = CandidateMatches(
+        names=names,
+        paths=paths,
+        match_score=np.array(finals, dtype=np.float64),
+        sim=np.array([round(sim, 4) for sim in match_sims], dtype=np.float64),
+        quality=np.array(quals, dtype=np.float64),
+        edu=np.array(edus, dtype=np.float64),
+        exp=np.array(exps, dtype=np.float64),
+        skill_gaps=gaps,
+    )
+    # stable, so ties keep input order like list.sort(reverse=True)
+    order = np.argsort(-ranked.match_score, kind="stable")
+    return ranked.take(order[: max(1, top_n)])
+
+
+def matches_to_jsonable(matches: Union[CandidateMatches, Sequence[CandidateMatch]]) -> List[Dict[str, Any]]:
+    cols = matches if isinstance(matches, CandidateMatches) else CandidateMatches.from_rows(matches)
     out: List[Dict[str, Any]] = []
-    for m in matches:
+    for name, path, score, sim, quality, edu, exp, gap in zip(
+        cols.names,
+        cols.paths,
+        cols.match_score.tolist(),
+        cols.sim.tolist(),
+        cols.quality.tolist(),
+        cols.edu.tolist(),
+        cols.exp.tolist(),
+        cols.skill_gaps,
+    ):
         out.append(
             {
-                "name": m.name,
-                "resume_path": m.resume_path,
-                "match_score": m.match_score,
-                "score": m.match_score,  # Flat score for frontend
-                "semantic_similarity": m.semantic_similarity,
-                "resume_quality_score": m.resume_quality_score,
-                "education_boost": m.education_boost,
-                "experience_boost": m.experience_boost,
+                "name": name,
+                "resume_path": path,
+                "match_score": score,
+                "score": score,  # Flat score for frontend
+                "semantic_similarity": sim,
+                "resume_quality_score": quality,
+                "education_boost": edu,
+                "experience_boost": exp,
                 "skill_gap": {
-                    "matched_skills": m.skill_gap.matched_skills,
-                    "missing_skills": m.skill_gap.missing_skills,
-                    "match_percentage": m.skill_gap.match_percentage,
+                    "matched_skills": gap.matched_skills,
+                    "missing_skills": gap.missing_skills,
+                    "match_percentage": gap.match_percentage,
                 },
-                "matched_skills": m.skill_gap.matched_skills,  # Flat skills for frontend
-                "missing_skills": m.skill_gap.missing_skills,  # Flat missing skills for frontend
-                "match_status": "High" if m.match_score >= 70 else "Medium" if m.match_score >= 40 else "Low"
+                "matched_skills": gap.matched_skills,  # Flat skills for frontend
+                "missing_skills": gap.missing_skills,  # Flat missing skills for frontend
+                "match_status": "High" if score >= 70 else "Medium" if score >= 40 else "Low"
             }
         )
     return out
-
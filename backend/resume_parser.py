@@ -8,7 +8,7 @@ Parse resumes from PDF, DOCX, and TXT and extract structured information:
 - Work experience (role, company, duration)
 
 This module focuses on pragmatic parsing with robust fallbacks:
-- PDF: best-effort text extraction (PyPDF2)
+- PDF: best-effort text extraction (pypdfium2, falling back to PyPDF2)
 - DOCX: paragraph extraction (python-docx)
 - TXT: read directly
 
@@ -18,18 +18,30 @@ can plug in more advanced NLP models later (spaCy NER, LLM extraction, etc.).
 
 from __future__ import annotations
 
+import bisect
+import functools
+import hashlib
+import itertools
+import multiprocessing
+import os
 import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 from backend.utils import (
     DEFAULT_SKILL_VOCAB,
     extract_emails,
     extract_phones,
+    find_phrases,
     guess_name_from_email,
+    list_files,
     normalize_skill,
     normalize_text,
+    phrase_automaton,
+    phrase_index,
     score_completeness,
     setup_logger,
     unique_preserve_order,
@@ -41,21 +53,51 @@ logger = setup_logger()
 
 SUPPORTED_EXTENSIONS = {".pdf", ".docx", ".txt"}
 
-@dataclass
+# Bump when parsing logic changes so cached results are invalidated.
+PARSER_VERSION = "1"
+RESUME_CACHE_DIR = "outputs/cache/resumes"
+
+_DIGIT_RE = re.compile(r"\d")
+_WORD_RE = re.compile(r"[A-Za-z]+")
+_HEADER_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz &/")
+_SECTION_KEYWORDS = ("experience", "education", "skills", "projects", "summary", "certifications")
+_BULLET_SPLIT_RE = re.compile(r"[,/|\n•\-\u2022]+")
+# common degrees
+_DEG_RE = re.compile(r"\b(b\.?tech|btech|be|b\.?e|bsc|m\.?tech|mtech|me|msc|mba|phd)\b", re.I)
+_YEAR_RE = re.compile(r"\b(19\d{2}|20\d{2})\b")
+# role @ company | role - company
+_EXP_PAT = re.compile(r"^(?P<role>.+?)\s*(?:@|-)\s*(?P<company>.+?)(?:\s*\|\s*(?P<duration>.+))?$")
+_DUR_RE = re.compile(r"\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)\b", re.I)
+_YEAR_SPAN_RE = re.compile(r"\b(20\d{2}|19\d{2})\s*[-–]\s*(20\d{2}|present|current)\b", re.I)
+
+# Column order of parsed_resumes_to_rows output.
+PARSED_RESUME_CSV_HEADER = (
+    "file_path",
+    "name",
+    "emails",
+    "phones",
+    "skills",
+    "education",
+    "experience",
+    "resume_quality_score",
+)
+
+
+@dataclass(slots=True)
 class Education:
     degree: Optional[str] = None
     institution: Optional[str] = None
     year: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Experience:
     role: Optional[str] = None
     company: Optional[str] = None
     duration: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedResume:
     file_path: str
     name: Optional[str]
@@ -84,22 +126,86 @@ class ParsedResume:
             "resume_quality_score": self.resume_quality_score,
         }
 
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "ParsedResume":
+        return cls(
+            file_path=d["file_path"],
+            name=d["name"],
+            emails=list(d["emails"]),
+            phones=list(d["phones"]),
+            skills=list(d["skills"]),
+            education=[Education(**e) for e in d["education"]],
+            experience=[Experience(**x) for x in d["experience"]],
+            raw_text_preview=d["raw_text_preview"],
+            resume_quality_score=d["resume_quality_score"],
+        )
+
+
+# PDFium is not thread-safe; serialize it across the parse thread pool and API threads.
+_PDFIUM_LOCK = threading.Lock()
+
 
 def _read_pdf(path: Path) -> str:
+    """
+    Extract PDF text with pypdfium2 (native PDFium) when installed,
+    otherwise with PyPDF2. Pages that fail to extract are skipped.
+    """
+    try:
+        import pypdfium2 as pdfium  # type: ignore
+    except ImportError:
+        return _read_pdf_pypdf2(path)
+
+    with _PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(str(path))
+        try:
+            n = len(pdf)
+            if n == 1:
+                return (_pdfium_page_text(pdf, 0) or "").strip()
+            parts: List[Optional[str]] = [None] * n
+            for i in range(n):
+                parts[i] = _pdfium_page_text(pdf, i)
+        finally:
+            pdf.close()
+    return "\n".join(p for p in parts if p is not None).strip()
+
+
+def _pdfium_page_text(pdf, i: int) -> Optional[str]:
+    try:
+        page = pdf[i]
+        textpage = page.get_textpage()
+        # PDFium separates lines with CRLF
+        text = (textpage.get_text_range() or "").replace("\r\n", "\n")
+        textpage.close()
+        page.close()
+        return text
+    except Exception:
+        # Some PDFs fail on certain pages; keep going.
+        return None
+
+
+def _read_pdf_pypdf2(path: Path) -> str:
     try:
         from PyPDF2 import PdfReader  # type: ignore
     except Exception as e:
-        raise RuntimeError("PyPDF2 is required for PDF parsing.") from e
+        raise RuntimeError("pypdfium2 or PyPDF2 is required for PDF parsing.") from e
 
     reader = PdfReader(str(path))
-    parts: List[str] = []
-    for page in reader.pages:
-        try:
-            parts.append(page.extract_text() or "")
-        except Exception:
-            # Some PDFs fail on certain pages; keep going.
-            continue
-    return "\n".join(parts).strip()
+    pages = reader.pages
+    n = len(pages)
+    if n == 1:
+        return (_pypdf2_page_text(pages[0]) or "").strip()
+    parts: List[Optional[str]] = [None] * n
+    for i, page in enumerate(pages):
+        parts[i] = _pypdf2_page_text(page)
+    return "\n".join(p for p in parts if p is not None).strip()
+
+
+def _pypdf2_page_text(page) -> Optional[str]:
+    try:
+        return page.extract_text() or ""
+    except Exception:
+        # Some PDFs fail on certain pages; keep going.
+        return None
 
 
 def _read_docx(path: Path) -> str:
@@ -136,52 +242,91 @@ def _extract_name(text: str, emails: List[str]) -> Optional[str]:
     - First non-empty line with mostly letters and <= 4 words
     - Otherwise fall back to email-based guess
     """
-    lines = [ln.strip() for ln in (text or "").splitlines() if ln.strip()]
-    for ln in lines[:8]:
-        if len(ln) > 60:
+    # only the first 8 non-empty lines matter; don't strip the whole document
+    stripped = (ln.strip() for ln in (text or "").splitlines())
+    capitalize = str.capitalize
+    for ln in itertools.islice(filter(None, stripped), 8):
+        if len(ln) > 60 or _DIGIT_RE.search(ln):
             continue
-        if re.search(r"\d", ln):
-            continue
-        words = re.findall(r"[A-Za-z]+", ln)
-        if 2 <= len(words) <= 4 and sum(len(w) for w in words) >= 6:
-            return " ".join(w.capitalize() for w in words)
+        words = _WORD_RE.findall(ln)
+        if 2 <= len(words) <= 4 and sum(map(len, words)) >= 6:
+            return " ".join(map(capitalize, words))
 
     if emails:
         return guess_name_from_email(emails[0])
     return None
 
 
-def _extract_section(text: str, header_keywords: Sequence[str]) -> str:
+def _is_section_header(ln_low: str) -> bool:
+    """
+    A short line of only [a-z &/] that names a known section.
+    Plain str/set ops instead of a regex per line.
+    """
+    return (
+        3 <= len(ln_low) <= 40
+        and _HEADER_CHARS.issuperset(ln_low)
+        and any(kw in ln_low for kw in _SECTION_KEYWORDS)
+    )
+
+
+class _SectionIndex:
+    """
+    One resume's lines split and lowercased once, with the positions of likely
+    section headers, so every extractor can slice its section without rescanning.
+    """
+
+    __slots__ = ("lines", "keys", "headers")
+
+    def __init__(self, text: str) -> None:
+        self.lines = [ln.rstrip() for ln in (text or "").splitlines()]
+        self.keys = [ln.strip().lower() for ln in self.lines]
+        self.headers = [j for j, key in enumerate(self.keys) if _is_section_header(key)]
+
+    def section(self, header_keywords: Sequence[str]) -> str:
+        headers = tuple(hk.lower() for hk in header_keywords)
+        start = next((i + 1 for i, key in enumerate(self.keys) if key.startswith(headers)), None)
+        if start is None:
+            return ""
+        # stop at next likely header
+        h = bisect.bisect_left(self.headers, start)
+        end = self.headers[h] if h < len(self.headers) else len(self.lines)
+        return "\n".join(self.lines[start:end]).strip()
+
+
+def _extract_section(
+    text: str, header_keywords: Sequence[str], sections: Optional[_SectionIndex] = None
+) -> str:
     """
     Extract a rough section by headers. Best-effort and format-agnostic.
+    Pass `sections` (built from the same text) to reuse its line split.
     """
-    t = text or ""
-    lines = [ln.rstrip() for ln in t.splitlines()]
-    headers = [hk.lower() for hk in header_keywords]
-
-    idxs: List[int] = []
-    for i, ln in enumerate(lines):
-        ln_low = ln.strip().lower()
-        if any(ln_low.startswith(h) for h in headers):
-            idxs.append(i)
-
-    if not idxs:
-        return ""
-
-    start = idxs[0] + 1
-    end = len(lines)
-    # stop at next likely header
-    for j in range(start, len(lines)):
-        ln_low = lines[j].strip().lower()
-        if re.fullmatch(r"[a-z &/]{3,40}", ln_low) and any(
-            kw in ln_low for kw in ["experience", "education", "skills", "projects", "summary", "certifications"]
-        ):
-            end = j
-            break
-    return "\n".join(lines[start:end]).strip()
-
-
-def extract_skills(text: str, skill_vocab: Optional[Sequence[str]] = None) -> List[str]:
+    if sections is None:
+        sections = _SectionIndex(text)
+    return sections.section(header_keywords)
+
+
+_DEFAULT_NORM_VOCAB: Tuple[str, ...] = tuple(normalize_skill(s) for s in DEFAULT_SKILL_VOCAB)
+
+
+@functools.lru_cache(maxsize=32)
+def _normalized_vocab(skill_vocab: Tuple[str, ...]) -> Tuple[str, ...]:
+    return tuple(normalize_skill(s) for s in skill_vocab)
+
+
+def _resolve_vocab(skill_vocab: Optional[Sequence[str]]) -> Tuple[str, ...]:
+    """
+    Normalized skill vocabulary; the default is normalized once at import.
+    """
+    if not skill_vocab:
+        return _DEFAULT_NORM_VOCAB
+    return _normalized_vocab(tuple(skill_vocab))
+
+
+def extract_skills(
+    text: str,
+    skill_vocab: Optional[Sequence[str]] = None,
+    sections: Optional[_SectionIndex] = None,
+) -> List[str]:
     """
     Extract skills using a hybrid approach:
     - If a SKILLS section exists, parse it aggressively
@@ -189,21 +334,20 @@ def extract_skills(text: str, skill_vocab: Optional[Sequence[str]] = None) -> Li
 
     Returns normalized unique skills.
     """
-    vocab = [normalize_skill(s) for s in (skill_vocab or DEFAULT_SKILL_VOCAB)]
+    vocab = _resolve_vocab(skill_vocab)
     t_norm = normalize_text(text)
 
-    skills_section = _extract_section(text, ["skills", "technical skills", "skills & tools"])
+    skills_section = _extract_section(text, ["skills", "technical skills", "skills & tools"], sections)
     section_norm = normalize_text(skills_section)
 
     found: List[str] = []
 
+    vocab_set, _ = phrase_index(vocab)
+
     def scan(hay: str) -> None:
-        for v in vocab:
-            if not v:
-                continue
-            # word-ish boundary match, but allow dots and plus signs
-            if re.search(rf"(^| )({re.escape(v)})( |$)", hay):
-                found.append(v)
+        # word-ish boundary match, but allow dots and plus signs; report in vocab order
+        matched = find_phrases(hay, vocab)
+        found.extend(v for v in vocab if v in matched)
 
     if section_norm:
         scan(section_norm)
@@ -212,60 +356,54 @@ def extract_skills(text: str, skill_vocab: Optional[Sequence[str]] = None) -> Li
 
     # also parse comma/bullet tokens from skills section if present
     if skills_section:
-        tokens = re.split(r"[,/|\n•\-\u2022]+", skills_section)
+        tokens = _BULLET_SPLIT_RE.split(skills_section)
         for tok in tokens:
             s = normalize_skill(tok)
-            if len(s) >= 2 and s in vocab:
+            if len(s) >= 2 and s in vocab_set:
                 found.append(s)
 
     return unique_preserve_order([f for f in found if f])
 
 
-def extract_education(text: str) -> List[Education]:
-    section = _extract_section(text, ["education", "academics"])
+def extract_education(text: str, sections: Optional[_SectionIndex] = None) -> List[Education]:
+    section = _extract_section(text, ["education", "academics"], sections)
     blob = section if section else text
     blob = blob.replace("\t", " ")
 
     edu_list: List[Education] = []
-    # common degrees
-    deg_re = re.compile(r"\b(b\.?tech|btech|be|b\.?e|bsc|m\.?tech|mtech|me|msc|mba|phd)\b", re.I)
-    year_re = re.compile(r"\b(19\d{2}|20\d{2})\b")
 
     lines = [ln.strip() for ln in blob.splitlines() if ln.strip()]
     for ln in lines:
-        if not deg_re.search(ln) and "university" not in ln.lower() and "college" not in ln.lower():
-            continue
-        degree = deg_re.search(ln).group(0) if deg_re.search(ln) else None
-        year = year_re.search(ln).group(0) if year_re.search(ln) else None
+        deg_m = _DEG_RE.search(ln)
+        if not deg_m:
+            ln_low = ln.lower()
+            if "university" not in ln_low and "college" not in ln_low:
+                continue
+        degree = deg_m.group(0) if deg_m else None
+        year_m = _YEAR_RE.search(ln)
+        year = year_m.group(0) if year_m else None
         institution = None
         # naive: institution is text after '-' or ',' if present
-        if "-" in ln:
-            parts = [p.strip() for p in ln.split("-", 1)]
-            if len(parts) == 2:
-                institution = parts[1]
-        elif "," in ln:
-            parts = [p.strip() for p in ln.split(",", 1)]
-            if len(parts) == 2:
-                institution = parts[1]
+        sep = ln.find("-")
+        if sep < 0:
+            sep = ln.find(",")
+        if sep >= 0:
+            institution = ln[sep + 1 :].strip()
 
         edu_list.append(Education(degree=degree, institution=institution, year=year))
 
     return edu_list
 
 
-def extract_experience(text: str) -> List[Experience]:
-    section = _extract_section(text, ["experience", "work experience", "professional experience"])
+def extract_experience(text: str, sections: Optional[_SectionIndex] = None) -> List[Experience]:
+    section = _extract_section(text, ["experience", "work experience", "professional experience"], sections)
     blob = section if section else text
     lines = [ln.strip() for ln in blob.splitlines() if ln.strip()]
 
     exp_list: List[Experience] = []
-    # role @ company | role - company
-    pat = re.compile(r"^(?P<role>.+?)\s*(?:@|-)\s*(?P<company>.+?)(?:\s*\|\s*(?P<duration>.+))?$")
-    dur_re = re.compile(r"\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)\b", re.I)
-    year_span_re = re.compile(r"\b(20\d{2}|19\d{2})\s*[-–]\s*(20\d{2}|present|current)\b", re.I)
 
     for ln in lines:
-        m = pat.match(ln)
+        m = _EXP_PAT.match(ln)
         if m:
             exp_list.append(
                 Experience(
@@ -277,27 +415,25 @@ def extract_experience(text: str) -> List[Experience]:
             continue
 
         # duration-only lines (e.g. "Jun 2022 - Present")
-        if dur_re.search(ln) or year_span_re.search(ln):
+        if _DUR_RE.search(ln) or _YEAR_SPAN_RE.search(ln):
             if exp_list and not exp_list[-1].duration:
                 exp_list[-1].duration = ln
 
     return exp_list
 
 
-def parse_resume(
-    path: Union[str, Path],
-    skill_vocab: Optional[Sequence[str]] = None,
-) -> ParsedResume:
-    p = Path(path)
+def _parse_resume_uncached(p: Path, skill_vocab: Optional[Sequence[str]] = None) -> ParsedResume:
     logger.info(f"Parsing resume: {p.name}")
 
     text = read_resume_text(p)
     emails = extract_emails(text)
     phones = extract_phones(text)
     name = _extract_name(text, emails)
-    skills = extract_skills(text, skill_vocab=skill_vocab)
-    education = extract_education(text)
-    experience = extract_experience(text)
+    # split lines and locate headers once for all three section extractors
+    sections = _SectionIndex(text)
+    skills = extract_skills(text, skill_vocab=skill_vocab, sections=sections)
+    education = extract_education(text, sections=sections)
+    experience = extract_experience(text, sections=sections)
 
     fields_present = {
         "name": bool(name),
@@ -328,66 +464,154 @@ def parse_resume(
     )
 
 
+@functools.lru_cache(maxsize=1)
+def _resume_disk_cache():
+    """
+    Cross-process cache of parsed resumes (diskcache), or None when diskcache
+    is not installed or RSS_RESUME_CACHE is "off".
+    """
+    path = os.environ.get("RSS_RESUME_CACHE", RESUME_CACHE_DIR).strip()
+    if not path or path.lower() == "off":
+        return None
+    try:
+        import diskcache  # type: ignore
+    except ImportError:
+        return None
+    try:
+        return diskcache.Cache(path)
+    except Exception as e:
+        logger.warning(f"Resume cache disabled ({path}): {e}")
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_cached(
+    path_str: str, mtime_ns: int, size: int, skill_vocab: Optional[Tuple[str, ...]]
+) -> Dict[str, Any]:
+    """
+    Parsed resume as a dict, memoized in-process and on disk. Keyed on the file's
+    mtime and size, so an edited file is always re-parsed.
+    `skill_vocab` is None for the default vocabulary, which the parser has pre-normalized.
+    """
+    vocab = skill_vocab or tuple(DEFAULT_SKILL_VOCAB)
+    key_src = "\0".join([PARSER_VERSION, path_str, str(mtime_ns), str(size), *vocab])
+    key = hashlib.blake2b(key_src.encode("utf-8"), digest_size=16).hexdigest()
+    cache = _resume_disk_cache()
+    if cache is not None:
+        hit = cache.get(key)
+        if hit is not None:
+            return hit
+
+    data = _parse_resume_uncached(Path(path_str), skill_vocab=skill_vocab).to_dict()
+    if cache is not None:
+        cache.set(key, data)
+    return data
+
+
+def parse_resume(
+    path: Union[str, Path],
+    skill_vocab: Optional[Sequence[str]] = None,
+) -> ParsedResume:
+    """
+    Parse one resume. Unchanged files (same path, mtime and size) are served
+    from cache instead of being re-extracted; each call gets a fresh object.
+    """
+    p = Path(path)
+    st = p.stat()
+    vocab = tuple(skill_vocab) if skill_vocab else None
+    return ParsedResume.from_dict(_parse_cached(str(p), st.st_mtime_ns, st.st_size, vocab))
+
+
+def _parse_resume_or_none(
+    path: Union[str, Path],
+    skill_vocab: Optional[Sequence[str]] = None,
+) -> Optional[ParsedResume]:
+    """
+    Worker entrypoint: a bad file is logged and skipped instead of failing the batch.
+    """
+    try:
+        return parse_resume(path, skill_vocab=skill_vocab)
+    except Exception as e:
+        logger.exception(f"Failed to parse resume {Path(path).name}: {e}")
+        return None
+
+
+def _init_parse_worker(skill_vocab: Optional[Tuple[str, ...]]) -> None:
+    """
+    Pool initializer: build the skill matcher (automaton and lookup set) once
+    per worker up front instead of on that worker's first resume.
+    """
+    vocab = _resolve_vocab(skill_vocab)
+    phrase_automaton(vocab)
+    phrase_index(vocab)
+
+
 def parse_resumes_in_dir(
     resumes_dir: Union[str, Path],
     skill_vocab: Optional[Sequence[str]] = None,
     extensions: Optional[Sequence[str]] = (".pdf", ".docx", ".txt"),
     max_workers: int = 4,
 ) -> List[ParsedResume]:
-    from backend.utils import list_files
-    from concurrent.futures import ThreadPoolExecutor
-
+    """
+    Parse every resume in a directory, in file order.
+    Parsing is CPU-bound, so it runs in forkserver worker processes; on
+    spawn-only platforms (Windows) threads are used instead. Like any
+    multiprocessing caller, scripts must guard their entry point with
+    `if __name__ == "__main__":`.
+    """
     files = list_files(resumes_dir, extensions=extensions)
     if not files:
         return []
 
-    logger.info(f"Parsing {len(files)} resumes in parallel (workers={max_workers})...")
-    
-    parsed: List[ParsedResume] = []
-    
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Map each file parsing to a thread
-        future_to_file = {executor.submit(parse_resume, fp, skill_vocab): fp for fp in files}
-        
-        from concurrent.futures import as_completed
-        for future in as_completed(future_to_file):
-            fp = future_to_file[future]
-            try:
-                data = future.result()
-                parsed.append(data)
-            except Exception as e:
-                logger.exception(f"Failed to parse resume {fp.name}: {e}")
-                
-    return parsed
-
-
-def parsed_resumes_to_rows(parsed_resumes: Sequence[ParsedResume]) -> List[Dict[str, Any]]:
+    # forkserver workers start from a clean single-threaded server, so forking a
+    # multi-threaded host (the API, a loaded model) is avoided. Spawn-only
+    # platforms (Windows) use threads.
+    use_processes = "forkserver" in multiprocessing.get_all_start_methods()
+    kind = "processes" if use_processes else "threads"
+    logger.info(f"Parsing {len(files)} resumes in parallel ({kind}, workers={max_workers})...")
+
+    vocab_key = tuple(skill_vocab) if skill_vocab else None
+    parse = functools.partial(_parse_resume_or_none, skill_vocab=skill_vocab)
+    chunksize = max(1, len(files) // (max_workers * 4))
+    pool_kwargs: Dict[str, Any] = {"initializer": _init_parse_worker, "initargs": (vocab_key,)}
+    if use_processes:
+        pool: Any = ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("forkserver"), **pool_kwargs
+        )
+    else:
+        # Threads share the matcher caches: build them once here so the
+        # per-thread initializers are cache hits rather than racing builds.
+        _init_parse_worker(vocab_key)
+        pool = ThreadPoolExecutor(max_workers=max_workers, **pool_kwargs)
+    # Launching forkserver workers fixes the global start method as a side effect
+    # (multiprocessing.spawn.get_preparation_data); undo that if it was unset.
+    method_unset = multiprocessing.get_start_method(allow_none=True) is None
+    try:
+        with pool as executor:
+            results = executor.map(parse, files, chunksize=chunksize)
+            return [r for r in results if r is not None]
+    finally:
+        if method_unset:
+            multiprocessing.set_start_method(None, force=True)
+
+
+def parsed_resumes_to_rows(parsed_resumes: Iterable[ParsedResume]) -> Iterator[Dict[str, Any]]:
     """
-    Flatten parsed resumes into CSV-friendly rows.
+    Flatten parsed resumes into CSV-friendly rows (keys: PARSED_RESUME_CSV_HEADER), lazily.
     """
-    rows: List[Dict[str, Any]] = []
     for r in parsed_resumes:
-        rows.append(
-            {
-                "file_path": r.file_path,
-                "name": r.name,
-                "emails": ", ".join(r.emails),
-                "phones": ", ".join(r.phones),
-                "skills": ", ".join(r.skills),
-                "education": "; ".join(
-                    [
-                        " | ".join([x for x in [e.degree, e.institution, e.year] if x])
-                        for e in (r.education or [])
-                    ]
-                ),
-                "experience": "; ".join(
-                    [
-                        " | ".join([x for x in [ex.role, ex.company, ex.duration] if x])
-                        for ex in (r.experience or [])
-                    ]
-                ),
-                "resume_quality_score": r.resume_quality_score,
-            }
-        )
-    return rows
+        yield {
+            "file_path": r.file_path,
+            "name": r.name,
+            "emails": ", ".join(r.emails),
+            "phones": ", ".join(r.phones),
+            "skills": ", ".join(r.skills),
+            "education": "; ".join(
+                " | ".join([x for x in [e.degree, e.institution, e.year] if x]) for e in (r.education or [])
+            ),
+            "experience": "; ".join(
+                " | ".join([x for x in [ex.role, ex.company, ex.duration] if x]) for ex in (r.experience or [])
+            ),
+            "resume_quality_score": r.resume_quality_score,
+        }
 
@@ -9,9 +9,7 @@ Compute skill gap reports between:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Sequence, Set
-
-from backend.utils import unique_preserve_order
+from typing import FrozenSet, List, Sequence, Union
 
 
 @dataclass
@@ -22,17 +20,22 @@ class SkillGapReport:
     match_percentage: float  # 0..100
 
 
-def _to_set(skills: Sequence[str]) -> Set[str]:
-    return {s.strip().lower() for s in skills if s and s.strip()}
+def skill_set(skills: Sequence[str]) -> FrozenSet[str]:
+    """
+    Normalized set of skills. Pass the result as `required_skills` to
+    generate_skill_gap to reuse one JD's set across many candidates.
+    """
+    return frozenset(s.strip().lower() for s in skills if s and s.strip())
 
 
 def generate_skill_gap(
     candidate_name: str,
     candidate_skills: Sequence[str],
-    required_skills: Sequence[str],
+    required_skills: Union[Sequence[str], FrozenSet[str]],
 ) -> SkillGapReport:
-    cand = _to_set(candidate_skills)
-    req = _to_set(required_skills)
+    cand = skill_set(candidate_skills)
+    # frozensets come from skill_set and are already normalized
+    req = required_skills if isinstance(required_skills, frozenset) else skill_set(required_skills)
 
     if not req:
         return SkillGapReport(
@@ -42,14 +45,15 @@ def generate_skill_gap(
             match_percentage=0.0,
         )
 
-    matched = sorted(cand.intersection(req))
-    missing = sorted(req.difference(cand))
+    # sets are already unique; sort only for stable display
+    matched = sorted(cand & req)
+    missing = sorted(req - cand)
     pct = round((len(matched) / max(len(req), 1)) * 100.0, 2)
 
     return SkillGapReport(
         candidate_name=candidate_name,
-        matched_skills=unique_preserve_order(matched),
-        missing_skills=unique_preserve_order(missing),
+        matched_skills=matched,
+        missing_skills=missing,
         match_percentage=pct,
     )
 
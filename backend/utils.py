@@ -11,13 +11,28 @@ Design goals:
 
 from __future__ import annotations
 
+import csv
+import functools
 import json
 import logging
 import os
 import re
+import string
 from dataclasses import asdict, is_dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+try:
+    import ahocorasick  # type: ignore
+except ImportError:
+    # Optional: callers fall back to their own pure-Python matching.
+    ahocorasick = None
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    # Optional: safe_json_dumps falls back to the stdlib json module.
+    orjson = None
 
 
 LOGGER_NAME = "resume_screening"
@@ -93,6 +108,20 @@ def ensure_dir(path: Union[str, Path]) -> Path:
     return p
 
 
+def _walk_files(directory: str, exts: Optional[Set[str]]) -> Iterable[Path]:
+    try:
+        it = os.scandir(directory)
+    except OSError:
+        # unreadable subdirectory; skip it like rglob does
+        return
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path, exts)
+            elif entry.is_file() and (not exts or os.path.splitext(entry.name)[1].lower() in exts):
+                yield Path(entry.path)
+
+
 def list_files(
     directory: Union[str, Path],
     extensions: Optional[Sequence[str]] = None,
@@ -100,21 +129,46 @@ def list_files(
     """
     List files under a directory. Optionally filter by extensions (case-insensitive),
     e.g. extensions=[".pdf", ".docx", ".txt"].
+    Walks with os.scandir so only kept entries become Path objects.
     """
     d = Path(directory)
-    if not d.exists():
+    if not d.is_dir():
         return []
 
-    files = [p for p in d.rglob("*") if p.is_file()]
-    if not extensions:
-        return files
+    exts = None
+    if extensions:
+        exts = {e.lower() if e.startswith(".") else f".{e.lower()}" for e in extensions}
+    return list(_walk_files(str(d), exts))
+
+
+_KEEP_CHARS = "abcdefghijklmnopqrstuvwxyz0123456789+#.- "
+
+
+class _KeepTable(dict):
+    """
+    str.translate table: kept characters map to themselves, anything else
+    (punctuation, whitespace, non-ASCII) becomes a space, memoized on first sight.
+    """
+
+    def __missing__(self, code: int) -> int:
+        self[code] = 32  # " "
+        return 32
+
+
+_KEEP_TABLE = _KeepTable({ord(c): ord(c) for c in _KEEP_CHARS})
 
-    exts = {e.lower() if e.startswith(".") else f".{e.lower()}" for e in extensions}
-    return [p for p in files if p.suffix.lower() in exts]
 
+# Short strings (skills, durations, degrees) repeat constantly across resumes and
+# are memoized; whole documents are not, so the cache never pins resume text.
+_NORMALIZE_CACHE_MAX_LEN = 256
 
-_WS_RE = re.compile(r"\s+")
-_NON_WORD_RE = re.compile(r"[^a-z0-9\+\#\.\- ]+")
+
+def _normalize_text(text: str) -> str:
+    # one C-level translate pass, then split/join collapses the spaces
+    return " ".join(text.lower().translate(_KEEP_TABLE).split())
+
+
+_normalize_text_cached = functools.lru_cache(maxsize=8192)(_normalize_text)
 
 
 def normalize_text(text: str) -> str:
@@ -124,10 +178,10 @@ def normalize_text(text: str) -> str:
     - strip noisy punctuation (keep + # . - for skills like c++, c#, node.js)
     - collapse whitespace
     """
-    t = (text or "").lower()
-    t = _NON_WORD_RE.sub(" ", t)
-    t = _WS_RE.sub(" ", t).strip()
-    return t
+    t = text or ""
+    if len(t) <= _NORMALIZE_CACHE_MAX_LEN:
+        return _normalize_text_cached(t)
+    return _normalize_text(t)
 
 
 def normalize_skill(skill: str) -> str:
@@ -137,21 +191,85 @@ def normalize_skill(skill: str) -> str:
     return normalize_text(skill)
 
 
+@functools.lru_cache(maxsize=32)
+def phrase_automaton(phrases: Tuple[str, ...]):
+    """
+    Build (once per phrase tuple) an Aho-Corasick automaton matching every
+    normalized phrase in a single pass. Phrases are padded with spaces so they
+    only match on word boundaries of space-padded normalized text.
+    Returns None when pyahocorasick is not installed or there is nothing to match.
+    """
+    if ahocorasick is None or not any(phrases):
+        return None
+    ac = ahocorasick.Automaton()
+    for ph in phrases:
+        if ph:
+            ac.add_word(f" {ph} ", ph)
+    ac.make_automaton()
+    return ac
+
+
+@functools.lru_cache(maxsize=32)
+def phrase_index(phrases: Tuple[str, ...]) -> Tuple[FrozenSet[str], int]:
+    """
+    Phrase lookup set plus the longest phrase length in words (for n-gram scanning).
+    """
+    phrase_set = frozenset(ph for ph in phrases if ph)
+    max_words = max((len(ph.split(" ")) for ph in phrase_set), default=0)
+    return phrase_set, max_words
+
+
+def _find_phrases_by_tokens(text_norm: str, phrases: Tuple[str, ...]) -> Set[str]:
+    """
+    Pure-Python fallback when pyahocorasick is missing: look up every 1..k
+    word n-gram of the normalized text in a frozenset. Normalized text is
+    single-space separated, so this matches phrases on the same word boundaries.
+    """
+    phrase_set, max_words = phrase_index(phrases)
+    tokens = text_norm.split(" ")
+    matched: Set[str] = set()
+    for n in range(1, max_words + 1):
+        for i in range(len(tokens) - n + 1):
+            gram = " ".join(tokens[i : i + n])
+            if gram in phrase_set:
+                matched.add(gram)
+    return matched
+
+
+def find_phrases(text_norm: str, phrases: Tuple[str, ...]) -> Set[str]:
+    """
+    Set of phrases occurring as whole words in normalized text (see normalize_text).
+    Uses the Aho-Corasick automaton when available, else an n-gram set lookup;
+    both find every phrase, including ones nested inside longer phrases.
+    """
+    ac = phrase_automaton(phrases)
+    if ac is None:
+        return _find_phrases_by_tokens(text_norm, phrases)
+    return {ph for _, ph in ac.iter(f" {text_norm} ")}
+
+
 def unique_preserve_order(items: Iterable[str]) -> List[str]:
-    seen = set()
-    out: List[str] = []
-    for it in items:
-        if it in seen:
-            continue
-        seen.add(it)
-        out.append(it)
-    return out
+    # dicts keep insertion order, so this dedupes in a single C-level pass
+    return list(dict.fromkeys(items))
+
+
+_ORJSON_OPTIONS = (
+    (orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
+)
 
 
 def safe_json_dumps(obj: Any, indent: int = 2) -> str:
     """
     JSON serialize while supporting dataclasses.
+    Uses orjson's native dataclass support when installed (indent=2 only).
     """
+    if orjson is not None and indent == 2:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode("utf-8")
+        except TypeError:
+            # e.g. integers beyond 64 bits; the stdlib path handles them
+            pass
+
     def default(o: Any) -> Any:
         if is_dataclass(o):
             return asdict(o)
@@ -186,8 +304,6 @@ def write_csv_rows(path: Union[str, Path], rows: List[Dict[str, Any]]) -> None:
         # pandas not available or failed; fallback to csv
         pass
 
-    import csv
-
     # stable header union
     header: List[str] = []
     for r in rows:
@@ -202,6 +318,46 @@ def write_csv_rows(path: Union[str, Path], rows: List[Dict[str, Any]]) -> None:
             w.writerow(r)
 
 
+def write_csv_stream(
+    path: Union[str, Path],
+    fieldnames: Sequence[str],
+    rows: Iterable[Dict[str, Any]],
+) -> None:
+    """
+    Write dict rows to CSV as they are produced, under a fixed header.
+    Unlike write_csv_rows, `rows` can be a generator and is consumed exactly once.
+    """
+    p = Path(path)
+    ensure_dir(p.parent)
+    with p.open("w", encoding="utf-8", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=list(fieldnames))
+        w.writeheader()
+        w.writerows(rows)
+
+
+def write_csv_columns(path: Union[str, Path], columns: Dict[str, Sequence[Any]]) -> None:
+    """
+    Write column-oriented data (dict of equal-length sequences) to CSV.
+    - If `pyarrow` is available, its C writer is used.
+    - Otherwise, rows are streamed through write_csv_stream.
+    """
+    p = Path(path)
+    ensure_dir(p.parent)
+    try:
+        import pyarrow as pa  # type: ignore
+        import pyarrow.csv as pa_csv  # type: ignore
+    except ImportError:
+        pa = None
+
+    if pa is not None:
+        pa_csv.write_csv(pa.table({k: list(v) for k, v in columns.items()}), str(p))
+        return
+
+    fieldnames = list(columns)
+    rows = (dict(zip(fieldnames, values)) for values in zip(*columns.values()))
+    write_csv_stream(p, fieldnames, rows)
+
+
 def write_text(path: Union[str, Path], text: str) -> None:
     p = Path(path)
     ensure_dir(p.parent)
@@ -212,6 +368,9 @@ def read_text(path: Union[str, Path]) -> str:
     return Path(path).read_text(encoding="utf-8", errors="ignore")
 
 
+_EMAIL_NAME_TABLE = _KeepTable({ord(c): ord(c) for c in string.ascii_letters + "."})
+
+
 def guess_name_from_email(email: str) -> Optional[str]:
     """
     Very lightweight heuristic to guess a name from an email.
@@ -219,19 +378,24 @@ def guess_name_from_email(email: str) -> Optional[str]:
     """
     if not email or "@" not in email:
         return None
-    local = email.split("@", 1)[0]
-    local = re.sub(r"[^a-zA-Z\.]+", " ", local).strip()
-    parts = [p for p in re.split(r"[ \.]+", local) if p]
+    # digits, symbols and non-ASCII become spaces; dots then split like spaces
+    parts = email.split("@", 1)[0].translate(_EMAIL_NAME_TABLE).replace(".", " ").split()
     if not parts:
         return None
     return " ".join(p.capitalize() for p in parts[:2])
 
 
+_EMAIL_RE = re.compile(r"[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}")
+_PHONE_RE = re.compile(r"(\+?\d[\d\-\s\(\)]{8,}\d)")
+
+
 def extract_emails(text: str) -> List[str]:
-    if not text:
+    if not text or "@" not in text:
         return []
+    # An email can't contain whitespace, so only tokens holding an "@" need the
+    # regex; this yields exactly the matches a full-text scan would.
     return unique_preserve_order(
-        re.findall(r"[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}", text)
+        m for tok in text.split() if "@" in tok for m in _EMAIL_RE.findall(tok)
     )
 
 
@@ -241,8 +405,8 @@ def extract_phones(text: str) -> List[str]:
     """
     if not text:
         return []
-    candidates = re.findall(r"(\+?\d[\d\-\s\(\)]{8,}\d)", text)
-    cleaned = [re.sub(r"\s+", " ", c).strip() for c in candidates]
+    candidates = _PHONE_RE.findall(text)
+    cleaned = [" ".join(c.split()) for c in candidates]
     return unique_preserve_order(cleaned)
 
 
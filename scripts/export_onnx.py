@@ -0,0 +1,49 @@
+"""
+export_onnx.py
+--------------
+Export a SentenceTransformers model to an optimized ONNX graph that
+backend.matcher picks up (RSS_BACKEND=onnx, the default). The default O3
+level is loaded automatically; for other levels set RSS_ONNX_FILE to the
+printed file name.
+
+Requires: pip install "sentence-transformers[onnx]"
+
+Example:
+  python scripts/export_onnx.py --model sentence-transformers/all-MiniLM-L6-v2 --out models/all-MiniLM-L6-v2
+  python -m backend.cli ... --model models/all-MiniLM-L6-v2
+"""
+
+from __future__ import annotations
+
+import argparse
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description="Export a SentenceTransformers model to optimized ONNX")
+    p.add_argument(
+        "--model",
+        default="sentence-transformers/all-MiniLM-L6-v2",
+        help="SentenceTransformers model name or local path.",
+    )
+    p.add_argument("--out", required=True, help="Directory to save the exported model into.")
+    p.add_argument("--level", default="O3", choices=["O1", "O2", "O3", "O4"], help="ONNX graph optimization level.")
+    return p
+
+
+def main() -> None:
+    args = build_arg_parser().parse_args()
+
+    from sentence_transformers import SentenceTransformer, export_optimized_onnx_model
+
+    model = SentenceTransformer(args.model, backend="onnx")
+    model.save(args.out)
+    # Writes <out>/onnx/model_<level>.onnx next to the plain export.
+    export_optimized_onnx_model(model, args.level, args.out)
+    print(f"Exported {args.model} ({args.level}) to {args.out}")
+    if args.level != "O3":
+        # backend.matcher loads model_O3.onnx unless told otherwise
+        print(f"Set RSS_ONNX_FILE=model_{args.level}.onnx so backend.matcher loads this graph.")
+
+
+if __name__ == "__main__":
+    main()